@@ -64,9 +64,16 @@ Ein Antrag ist OK (all_ok = True), wenn BEIDE Bedingungen erfüllt sind:
     all_ok = meldezettel_ok AND (jahresrechnung_ok OR zahlung_ok OR monatsrechnungen_ok)
 """
 
+import logging
 from pathlib import Path
 from typing import Tuple
 
+# Pro-Case-Diagnose läuft über das logging-Modul statt über print():
+# Mit dem ProcessPoolExecutor in main.py würden sich print()-Ausgaben
+# der Worker auf stdout verschränken. Sichtbar per LOGLEVEL=DEBUG
+# (gleiches Muster wie klimaticket.batch / klimaticket.registration).
+logger = logging.getLogger("klimaticket.decision")
+
 # ─────────────────────────────────────────────────────────────────────────────
 # IMPORTS AUS ANDEREN MODULEN
 # ─────────────────────────────────────────────────────────────────────────────
@@ -188,9 +195,9 @@ def reclassify_short_jahresrechnungen(
 
             # Reklassifizieren, wenn Zeitraum erkannt UND zu kurz
             if leist_months is not None and leist_months < MIN_MONTHS_JAHRESRECHNUNG:
-                print(f"  Reklassifizierung: {pdf_path.name} "
-                      f"jahresrechnung → monatsrechnung "
-                      f"(Leistungszeitraum: {leist_months} Monate)")
+                logger.debug("  Reklassifizierung: %s jahresrechnung → monatsrechnung "
+                             "(Leistungszeitraum: %s Monate)",
+                             pdf_path.name, leist_months)
                 doc_type = "monatsrechnung"
 
             # WICHTIG: Wenn kein Leistungszeitraum erkannt wurde (leist_months = None),
@@ -259,10 +266,12 @@ def build_melde_decision(form_data: dict,
     # Bei nur einem Kandidaten wird natürlich dieser genommen.
     best_path, best_text, best_confidence = max(candidates, key=lambda c: c[2])
 
-    # Debug-Ausgabe (erscheint in der Konsole beim Batch-Lauf)
-    print(f"Meldezettel gewählt: {best_path.name} (Konfidenz: {best_confidence:.1%})")
+    # Debug-Ausgabe (im Batch-Lauf sichtbar mit LOGLEVEL=DEBUG)
+    logger.debug("Meldezettel gewählt: %s (Konfidenz: %.1f%%)",
+                 best_path.name, best_confidence * 100)
     if len(candidates) > 1:
-        print(f"  ({len(candidates)} Kandidaten, {len(candidates)-1} verworfen)")
+        logger.debug("  (%d Kandidaten, %d verworfen)",
+                     len(candidates), len(candidates) - 1)
 
     # ── 4. Inhaltliche Validierung ──
     # process_meldezettel() ist in registration_validation.py definiert.
@@ -434,7 +443,10 @@ def build_invoice_decision(form_data: dict,
             #   • leist_months: Wie viele Monate umfasst der Leistungszeitraum?
             #   • leist_in_guelt: Liegt der Leistungszeitraum innerhalb der Gültigkeit?
             #   • all_ok:       Alle Checks bestanden?
-            j_res = validate_rechnung(form_data, text)
+            # verbose=False: Im Batch laufen die Worker parallel — die
+            # Debug-Blöcke (inkl. des reinen Debug-Scans nach dem
+            # Karteninhaber-Namen) entfallen damit im heißen Pfad.
+            j_res = validate_rechnung(form_data, text, verbose=False)
 
             # Dateiname merken — wird im Excel angezeigt ("welche PDF wurde gewählt?")
             j_res['_source_file'] = pdf_path.name
@@ -448,7 +460,7 @@ def build_invoice_decision(form_data: dict,
             #   • name_ok:   Ist "Vorname Nachname" im Text nahe "für"?
             #   • period_ok: Stimmt der Zeitraum mit dem Antrag überein?
             #   • all_ok:    Alle Checks bestanden?
-            z_res = validate_zahlungsbestaetigung(form_data, text)
+            z_res = validate_zahlungsbestaetigung(form_data, text, verbose=False)
             z_res['_source_file'] = pdf_path.name
             zahlung_candidates.append(z_res)
 
@@ -470,7 +482,7 @@ def build_invoice_decision(form_data: dict,
                 #   • leist_ok:        Leistungszeitraum liegt innerhalb Gültigkeit?
                 #   • leist_month_key: Monatsschlüssel, z.B. "2024-09"
                 #   • all_ok:          Alle Checks bestanden?
-                m_res = validate_monatsrechnung(form_data, page_text)
+                m_res = validate_monatsrechnung(form_data, page_text, verbose=False)
 
                 # Nur gültige Monatsrechnungen zählen
                 if m_res.get('all_ok'):
@@ -479,8 +491,8 @@ def build_invoice_decision(form_data: dict,
                         valid_months.add(month_key)
 
             if len(pages) > 1:
-                print(f'  Monatsrechnung {pdf_path.name}: {len(pages)} Seiten, '
-                      f'{len(valid_months)} gültige Monate bisher')
+                logger.debug('  Monatsrechnung %s: %d Seiten, %d gültige Monate bisher',
+                             pdf_path.name, len(pages), len(valid_months))
 
     # ══════════════════════════════════════════════════════════════════════════
     # PHASE 2: Beste Jahresrechnung auswählen
@@ -498,9 +510,10 @@ def build_invoice_decision(form_data: dict,
 
         # Log bei mehreren Kandidaten, damit man im Batch-Lauf sieht, was passiert
         if len(jahresrechnung_candidates) > 1:
-            print(f'  Jahresrechnung: {len(jahresrechnung_candidates)} Kandidaten, '
-                  f'gewählt: {jahresrechnung_details.get("_source_file")} '
-                  f'(all_ok={jahresrechnung_ok})')
+            logger.debug('  Jahresrechnung: %d Kandidaten, gewählt: %s (all_ok=%s)',
+                         len(jahresrechnung_candidates),
+                         jahresrechnung_details.get("_source_file"),
+                         jahresrechnung_ok)
     else:
         jahresrechnung_details = None
         jahresrechnung_ok = False
@@ -517,9 +530,10 @@ def build_invoice_decision(form_data: dict,
         zahlung_ok = bool(zahlung_details.get('all_ok'))
 
         if len(zahlung_candidates) > 1:
-            print(f'  Zahlungsbestätigung: {len(zahlung_candidates)} Kandidaten, '
-                  f'gewählt: {zahlung_details.get("_source_file")} '
-                  f'(all_ok={zahlung_ok})')
+            logger.debug('  Zahlungsbestätigung: %d Kandidaten, gewählt: %s (all_ok=%s)',
+                         len(zahlung_candidates),
+                         zahlung_details.get("_source_file"),
+                         zahlung_ok)
     else:
         zahlung_details = None
         zahlung_ok = False
@@ -54,6 +54,10 @@ WO WIRD DIESES MODUL VERWENDET?
         → decision_engine.build_overall_decision(form_data, classified_pdfs)
 """
 
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import joblib
 from typing import Literal, Tuple
@@ -225,7 +229,10 @@ def classify_document(text: str) -> Tuple[DocumentType, float]:
 #       jahresrechnung.pdf
 #       (optional: zahlungsbestaetigung.pdf, monatsrechnung_1.pdf, ...)
 
-def classify_case_pdfs(case_dir: Path) -> list[tuple[Path, str, str, float]]:
+def classify_case_pdfs(
+    case_dir: Path,
+    pdf_paths: list[Path] | None = None,
+) -> list[tuple[Path, str, str, float]]:
     """
     Klassifiziert alle PDFs in einem Case-Ordner.
 
@@ -235,7 +242,12 @@ def classify_case_pdfs(case_dir: Path) -> list[tuple[Path, str, str, float]]:
         3. Ergebnis als 4-Tupel speichern
 
     Parameter:
-        case_dir: Pfad zum Case-Ordner, z.B. Path("data/cases/20001")
+        case_dir:  Pfad zum Case-Ordner, z.B. Path("data/cases/20001")
+        pdf_paths: Optional eine bereits eingesammelte Liste der PDFs in
+                   case_dir (z.B. aus dem Verzeichnis-Index in main.py).
+                   Spart den glob()-Scan pro Case — auf Netzlaufwerken
+                   ist jeder Verzeichnis-Scan spürbar. Ohne Angabe wird
+                   wie bisher selbst gescannt.
 
     Rückgabe:
         Liste von 4-Tupeln, jedes Tupel:
@@ -259,25 +271,153 @@ def classify_case_pdfs(case_dir: Path) -> list[tuple[Path, str, str, float]]:
         meldezettel.pdf: meldezettel (87%)
         rechnung.pdf: jahresrechnung (94%)
     """
-    results: list[tuple[Path, str, str, float]] = []
+    # Alle .pdf-Dateien im Ordner einsammeln — außer der Aufrufer hat
+    # sie schon mitgebracht (Verzeichnis-Index in main.py).
+    # Doppelter Check: glob("*.pdf") könnte theoretisch auch .PDF liefern,
+    # aber zur Sicherheit nochmal prüfen
+    if pdf_paths is None:
+        pdf_paths = [p for p in case_dir.glob("*.pdf") if p.suffix.lower() == ".pdf"]
+    if not pdf_paths:
+        return []
+
+    # Die PDFs eines Cases sind unabhängig → Extraktion + Klassifikation
+    # laufen in einem kleinen Thread-Pool parallel. Die eigentliche Arbeit
+    # passiert in C-Code (pypdf/Poppler/Tesseract), der den GIL freigibt —
+    # ein Case mit mehreren Monatsrechnungen braucht dann ungefähr
+    # max(PDF-Zeit) statt sum(PDF-Zeit).
+    # ex.map() erhält die Eingabe-Reihenfolge, das Ergebnis bleibt also
+    # deterministisch wie beim alten sequentiellen Loop.
+    if len(pdf_paths) == 1:
+        return [_extract_and_classify(pdf_paths[0])]
+
+    with ThreadPoolExecutor(max_workers=min(8, len(pdf_paths))) as ex:
+        return list(ex.map(_extract_and_classify, pdf_paths))
 
-    # Alle .pdf-Dateien im Ordner durchgehen
-    for pdf_path in case_dir.glob("*.pdf"):
-        # Doppelter Check: glob("*.pdf") könnte theoretisch auch .PDF liefern,
-        # aber zur Sicherheit nochmal prüfen
-        if pdf_path.suffix.lower() != ".pdf":
-            continue
 
-        # Text aus dem PDF extrahieren (inkl. OCR bei Bild-PDFs)
-        # Der document_loader trennt Seiten mit \f (Form Feed),
-        # was bei Multi-Page-Monatsrechnungen wichtig ist.
-        text = extract_text_from_pdf(pdf_path)
+# =============================================================================
+# EXTRAKTIONS-/KLASSIFIKATIONS-CACHE (pro PDF-Datei)
+# =============================================================================
+#
+# Beim Iterieren an den Validierungsregeln wird der Batch oft mehrfach
+# über dieselben, unveränderten PDFs laufen gelassen. OCR ist dabei mit
+# Abstand der teuerste Schritt (~2-5 s pro Seite).
+#
+# Der Cache hat ZWEI Schlüssel-Ebenen:
+#
+#   1. Fingerprint (Pfad, mtime_ns, Größe) → .classify_cache/<sha1>.json
+#      Billigster Check (ein stat-Aufruf). Trifft, solange dieselbe
+#      Datei am selben Ort unverändert liegt.
+#
+#   2. Inhalts-Hash (SHA-256 der PDF-Bytes) → .classify_cache/by_hash/<sha256>.json
+#      Trifft auch, wenn dieselbe PDF unter ANDEREM Pfad auftaucht —
+#      z.B. die gleiche Monatsrechnung, die in mehreren Case-Ordnern
+#      abgelegt wurde, oder eine umbenannte Kopie. Das Hashen der Bytes
+#      kostet Millisekunden und erspart den Sekunden-teuren OCR-Pfad.
+#
+# Ändert sich die Datei, ändern sich beide Schlüssel → automatischer
+# Cache-Miss. Invalidierung von Hand: den Ordner .classify_cache/ löschen.
+#
+# WICHTIG: Nach einem Modell-Update (neue .joblib-Dateien) muss der
+# Cache gelöscht werden, weil doc_type/confidence mitgecacht sind.
+
+CACHE_DIR = PROJECT_ROOT / ".classify_cache"
+HASH_CACHE_DIR = CACHE_DIR / "by_hash"
+
+# In-Process-Merkzettel: Inhalts-Hash → Ergebnis. Fängt Duplikate
+# innerhalb EINES Laufs ab, ohne die Platte anzufassen.
+_HASH_RESULTS: dict[str, tuple[str, str, float]] = {}
+
+
+def _cache_key(pdf_path: Path) -> str:
+    """
+    Fingerprint einer PDF-Datei: SHA1 über (absoluter Pfad, mtime_ns, Größe).
+    """
+    st = pdf_path.stat()
+    raw = f"{pdf_path.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _write_cache_json(cache_path: Path, payload: dict) -> None:
+    """
+    Schreibt einen Cache-Eintrag atomar (Temp-Datei + os.replace).
+
+    So sieht ein paralleler Leser nie einen halb geschriebenen Eintrag.
+    Schreibfehler (z.B. read-only Dateisystem) sind unkritisch →
+    der Cache wird dann einfach nicht befüllt.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _extract_and_classify(pdf_path: Path) -> tuple[Path, str, str, float]:
+    """
+    Extrahiert den Text EINER PDF und klassifiziert ihn (mit Datei-Cache).
 
-        # ML-Klassifikation durchführen
-        doc_type, confidence = classify_document(text)
+    Hilfsfunktion für classify_case_pdfs() — ein Aufruf pro PDF,
+    damit die PDFs eines Cases parallel verarbeitet werden können.
 
-        # 4-Tupel speichern — dieses Format wird von der gesamten
-        # Pipeline erwartet (decision_engine, main.py, app.py)
-        results.append((pdf_path, doc_type, text, confidence))
+    Unveränderte PDFs werden beim zweiten Lauf aus .classify_cache/
+    bedient — OCR und ML-Klassifikation entfallen dann komplett.
 
-    return results
\ No newline at end of file
+    Rückgabe:
+        4-Tupel (pdf_path, doc_type, text, confidence) — dieses Format
+        wird von der gesamten Pipeline erwartet (decision_engine, main.py, app.py).
+    """
+    # ── Stufe 1: Fingerprint-Lookup (Pfad, mtime, Größe) ──
+    # Defekte/unlesbare Cache-Dateien werden ignoriert und neu berechnet.
+    cache_path = CACHE_DIR / f"{_cache_key(pdf_path)}.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        return (pdf_path, cached["doc_type"], cached["text"], cached["confidence"])
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # ── Stufe 2: Inhalts-Hash-Lookup (SHA-256 der Bytes) ──
+    # Fängt dieselbe PDF unter anderem Pfad/Namen ab — in echten Batches
+    # sind 5-15% der PDFs solche Duplikate. Das Hashen kostet nur
+    # Millisekunden, verglichen mit Sekunden für den OCR-Pfad.
+    content_hash = hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+
+    hit = _HASH_RESULTS.get(content_hash)
+    if hit is None:
+        hash_path = HASH_CACHE_DIR / f"{content_hash}.json"
+        try:
+            with open(hash_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            hit = (cached["doc_type"], cached["text"], cached["confidence"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+    if hit is not None:
+        doc_type, text, confidence = hit
+        _HASH_RESULTS[content_hash] = hit
+        # Fingerprint-Eintrag nachziehen, damit der nächste Lauf schon
+        # in Stufe 1 trifft (ohne die Bytes nochmal zu hashen).
+        _write_cache_json(
+            cache_path,
+            {"doc_type": doc_type, "text": text, "confidence": confidence},
+        )
+        return (pdf_path, doc_type, text, confidence)
+
+    # Text aus dem PDF extrahieren (inkl. OCR bei Bild-PDFs)
+    # Der document_loader trennt Seiten mit \f (Form Feed),
+    # was bei Multi-Page-Monatsrechnungen wichtig ist.
+    text = extract_text_from_pdf(pdf_path)
+
+    # ML-Klassifikation durchführen
+    doc_type, confidence = classify_document(text)
+
+    # ── Beide Cache-Ebenen befüllen ──
+    payload = {"doc_type": doc_type, "text": text, "confidence": confidence}
+    _HASH_RESULTS[content_hash] = (doc_type, text, confidence)
+    _write_cache_json(cache_path, payload)
+    _write_cache_json(HASH_CACHE_DIR / f"{content_hash}.json", payload)
+
+    return (pdf_path, doc_type, text, confidence)
\ No newline at end of file
@@ -48,7 +48,8 @@ Die Decision Engine splittet dann an \\f und validiert jede Seite einzeln.
 ABHÄNGIGKEITEN
 --------------
     Python-Pakete:
-        pypdf       — PDF-Parsing, Textlayer auslesen
+        PyMuPDF     — Textlayer auslesen (schneller Standardpfad)
+        pypdf       — PDF-Parsing, Textlayer auslesen (Fallback ohne PyMuPDF)
         pdf2image   — PDF-Seiten als Bilder rendern (nutzt Poppler)
         pytesseract — Python-Wrapper für Tesseract OCR
         Pillow      — Bildverarbeitung (von pdf2image/pytesseract genutzt)
@@ -67,10 +68,20 @@ import re
 import shutil
 from pathlib import Path
 
-from pypdf import PdfReader             # PDF-Parsing: Textlayer auslesen
+from pypdf import PdfReader             # PDF-Parsing: Textlayer auslesen (Fallback)
 from pdf2image import convert_from_path  # PDF-Seite → Bild (nutzt Poppler/pdftoppm)
 import pytesseract                       # Bild → Text (nutzt Tesseract OCR)
 
+# PyMuPDF (fitz) ist für das Auslesen des Textlayers deutlich schneller
+# als pypdf (typisch 5–30×) und liefert bei digital erstellten PDFs
+# saubereren Text. Es ist aber ein kompiliertes Paket — falls es in einer
+# Umgebung fehlt, fällt extract_text_from_pdf() automatisch auf pypdf
+# zurück. Das Verhalten nach außen ist identisch.
+try:
+    import fitz                          # PyMuPDF: schneller Textlayer-Reader
+except ImportError:
+    fitz = None
+
 
 # =============================================================================
 # PLATTFORM-KONFIGURATION (Windows vs. Linux/Cloud)
@@ -417,7 +428,8 @@ def extract_text_from_pdf(path: Path) -> str:
     Extrahiert den gesamten Text aus einer PDF-Datei.
 
     Strategie pro Seite:
-        1. Textlayer mit pypdf auslesen (page.extract_text())
+        1. Textlayer auslesen — mit PyMuPDF (fitz), falls installiert,
+           sonst mit pypdf (page.extract_text())
         2. Qualitätsprüfung mit looks_like_bad_textlayer()
         3. Falls brauchbar → direkt verwenden (~1 ms pro Seite)
         4. Falls kaputt/leer → OCR-Fallback (~2–5 s pro Seite)
@@ -445,8 +457,18 @@ def extract_text_from_pdf(path: Path) -> str:
         True
     """
 
-    # pypdf liest die interne PDF-Struktur (Seiten, Fonts, Textlayer)
-    reader = PdfReader(path)
+    # ── Textlayer aller Seiten auslesen ──
+    # Bevorzugt PyMuPDF (fitz): 5–30× schneller als pypdf und bei
+    # digital erstellten PDFs (ÖBB-Rechnungen, Klimaticket-Bestätigungen)
+    # der dominante Zeitfaktor pro Fall. pypdf bleibt als Fallback,
+    # falls PyMuPDF in der Umgebung nicht installiert ist.
+    # Beide Pfade liefern pro Seite einen String ("" bei reinen Bild-PDFs).
+    if fitz is not None:
+        with fitz.open(path) as doc:
+            page_texts = [page.get_text("text") or "" for page in doc]
+    else:
+        reader = PdfReader(path)
+        page_texts = [page.extract_text() or "" for page in reader.pages]
 
     # Gesammelter Text pro Seite
     parts: list[str] = []
@@ -454,11 +476,9 @@ def extract_text_from_pdf(path: Path) -> str:
     # ── Jede Seite einzeln verarbeiten ──
     # enumerate startet bei 1, weil pdf2image 1-basierte Seitenindizes
     # erwartet (Seite 1 = first_page=1, nicht 0).
-    for idx, page in enumerate(reader.pages, start=1):
+    for idx, raw in enumerate(page_texts, start=1):
 
-        # Textlayer direkt auslesen (pypdf).
-        # Gibt den eingebetteten Text zurück, oder "" bei reinen Bild-PDFs.
-        text = (page.extract_text() or "").strip()
+        text = raw.strip()
 
         # Qualitätsprüfung: Textlayer vorhanden UND brauchbar?
         if text and not looks_like_bad_textlayer(text):
@@ -1025,8 +1025,10 @@ def validate_rechnung(form_data: dict, text: str, verbose: bool = True) -> dict:
         markers=[ (["karteninhaber"], 12) ],
     )
 
-    # Debug-Name extrahieren (NUR für Ausgabe, NICHT für Validierung)
-    dbg_name = extract_name_from_rechnung(text)
+    # Debug-Name extrahieren (NUR für Ausgabe, NICHT für Validierung).
+    # Der Regex-Scan über den kompletten Rechnungstext läuft nur noch im
+    # verbose-Modus — im Batch-Betrieb (verbose=False) entfällt er ganz.
+    dbg_name = extract_name_from_rechnung(text) if verbose else None
 
     # ── 2) Gültigkeitszeitraum aus PDF extrahieren ──
     von_str, bis_str = extract_period_from_rechnung(text)
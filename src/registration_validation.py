@@ -83,11 +83,19 @@ ABHÃ„NGIGKEITEN
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+import logging
 import re
 import unicodedata
 from typing import Optional, Dict, Any
 
+# Diagnose laeuft wie in main.py ueber das logging-Modul statt ueber
+# print(): Bei deaktiviertem DEBUG-Level kostet ein logger.debug()-Aufruf
+# nur den Level-Check — kein String-Formatting, kein stdout-Flush.
+# Sichtbar machen per LOGLEVEL=DEBUG (siehe basicConfig in main.py).
+logger = logging.getLogger("klimaticket.registration")
+
 # Shared Hilfsfunktionen aus utils.py:
 #   normalize_for_matching()  â†’ Lowercase, Umlaute entfernen, Whitespace normalisieren
 #   _compact()                â†’ Alle Leerzeichen entfernen ("a b c" â†’ "abc")
@@ -98,6 +106,41 @@ except ImportError:
     from utils import normalize_for_matching, _compact, _variants_for_umlaut_translit
 
 
+# Vorkompilierte Regex-Muster (Hot Path).
+# Diese Muster laufen pro Meldezettel viele Male (einmal pro Zeile bzw.
+# pro extrahiertem Wert). Einmal auf Modul-Ebene kompilieren spart den
+# Cache-Lookup im re-Modul bei jedem Aufruf.
+_RE_COLS = re.compile(r"\s{2,}")              # Spaltentrenner (Layout D: 2+ Leerzeichen)
+_RE_PLZ = re.compile(r"\b\d{4}\b")            # 4-stellige Postleitzahl
+
+# Datums-Bereinigung in EINEM Durchlauf (str.translate, C-Level):
+# Leerzeichen raus, Komma -> Punkt, OCR-Buchstaben -> Ziffern.
+#
+# Bewusst permissiver als die frueheren Lookbehind-Regexe (O/l/I werden
+# UEBERALL ersetzt, nicht nur zwischen Ziffern): In einem Datumsstring
+# kommen ohnehin nur Ziffern und Trenner vor, und die Kalender-
+# Validierung danach verwirft alles Unsinnige. Nebeneffekt: auch ein
+# fuehrendes "O1." oder "l5." wird jetzt repariert.
+_DATE_TRANS = str.maketrans({
+    " ": ".",             # Leerzeichen als Trenner: "01. 06. 1985" ok;
+                          # NICHT loeschen, sonst verschmilzt bei
+                          # "1990-01-01 00:00:00" das Datum mit der Zeit
+                          # ("01"+"00" -> Token "0100").
+    ",": ".",             # "01,01,1990"   -> "01.01.1990"
+    "O": "0", "o": "0",   # "O1.O6.1985"   -> "01.06.1985"
+    "l": "1", "I": "1",   # "l5.06.1985"   -> "15.06.1985"
+})
+
+# Trenner beim Datums-Parsing: alles, was keine Ziffer ist.
+_RE_NON_DIGIT = re.compile(r"\D+")
+
+# Zeichen, die in einem bereinigten Datum nichts verloren haben.
+# Erlaubt sind nur Ziffern und die ueblichen Trenner (. - : T).
+# Alles andere (z.B. ein unbekannter OCR-Buchstabe) macht den Wert
+# unparsbar — wie frueher bei der strptime-Kaskade.
+_RE_DATE_JUNK = re.compile(r"[^0-9.\-:T]")
+
+
 # =============================================================================
 # 1) LABEL/VALUE-EXTRAKTION AUS MELDEZETTEL
 # =============================================================================
@@ -142,14 +185,36 @@ _LABELS = {
 # Normalisierte Versionen der Labels (via normalize_for_matching):
 # "familienname oder nachname" â†’ "familienname oder nachname" (bereits lowercase)
 # Werden fÃ¼r den Vergleich mit normalisierten Zeilen verwendet.
-_LABELS_NORM = {normalize_for_matching(x) for x in _LABELS}
+# frozenset statt set: Die Mengen sind nach dem Import unveraenderlich —
+# das dokumentiert die Absicht und haelt den Lookup-Pfad schlank.
+_LABELS_NORM: frozenset[str] = frozenset(normalize_for_matching(x) for x in _LABELS)
 
 # Compact-Versionen (alle Leerzeichen entfernt):
 # "familienname oder nachname" â†’ "familiennameodernachname"
 # Werden gebraucht, weil OCR Labels manchmal mit Leerzeichen durchsetzt:
 # "Staatsa ngehÃ¶rig keit" â†’ normalisiert: "staatsa ngehorig keit"
 # â†’ compact: "staatsangehorigkkeit" â†’ matcht gegen "staatsangehorigkeit"
-_LABELS_COMPACT = {_compact(x) for x in _LABELS_NORM}
+_LABELS_COMPACT: frozenset[str] = frozenset(_compact(x) for x in _LABELS_NORM)
+
+# Obergrenze fuer die Label-Pruefung: Ist der normalisierte Key deutlich
+# laenger als das laengste bekannte Label, kann er kein Label sein —
+# lange Fliesstext-Zeilen ("Im lokalen Melderegister ...") werden so
+# verworfen, ohne dass ihre Compact-Form gebaut werden muss.
+# (+4 als Toleranz fuer OCR-Leerzeichen im Key.)
+_MAX_LABEL_LEN = max(map(len, _LABELS_NORM)) + 4
+
+# Anfangsbuchstaben aller bekannten Labels: Weder der exakte noch der
+# Compact-Vergleich kann treffen, wenn schon das erste Zeichen des Keys
+# in keinem Label vorkommt — billigster Vorfilter fuer Wert-Zeilen.
+_LABEL_FIRST_CHARS = frozenset(s[0] for s in _LABELS_NORM)
+
+# Vereinigung beider Mengen fuer den kombinierten Lookup in
+# _classify_line: Trifft schon der normalisierte Key (auch in seiner
+# bereits zusammengeklebten OCR-Form), entfaellt der _compact-Aufruf.
+# Semantisch identisch zur Zwei-Mengen-Pruefung: Ein Key ohne
+# Leerzeichen ist seine eigene Compact-Form, einer mit Leerzeichen
+# kann nie in _LABELS_COMPACT liegen.
+_LABELS_ALL: frozenset[str] = _LABELS_NORM | _LABELS_COMPACT
 
 
 # â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
@@ -189,14 +254,32 @@ def _label_key_of(line: str) -> str:
     if not s:
         return ""
 
-    if ":" in s:
-        left, right = s.split(":", 1)
-        if right.strip():
-            return ""  # Hat bereits Wert rechts vom ":" â†’ kein Label-only
-        return normalize_for_matching(left)
+    # str.partition statt '":" in s' + split: ein Scan, kein Listen-
+    # Zwischenobjekt. Ohne Doppelpunkt ist left die ganze Zeile
+    # (Linz-Layout), sep/right sind leer.
+    left, sep, right = s.partition(":")
+    if sep and right.strip():
+        return ""  # Hat bereits Wert rechts vom ":" â†’ kein Label-only
+    return normalize_for_matching(left)
 
-    # Kein Doppelpunkt â†’ die ganze Zeile kÃ¶nnte ein Label sein (Linz-Layout)
-    return normalize_for_matching(s)
+
+@lru_cache(maxsize=4096)
+def _classify_line(line: str) -> tuple[bool, str]:
+    """
+    Klassifiziert eine Zeile in EINEM Durchgang:
+        (ist_label_only, label_key_norm)
+
+    Buendelt _is_label_only_line + _label_key_of: Die Block-Logik in
+    extract_value_after_label und der Single-Pass-Parser brauchen
+    beide Informationen fuer dieselbe Zeile — vorher zwei Aufrufe mit
+    doppelter Normalisierung, jetzt einer (memoisiert).
+    """
+    key = _label_key_of(line)
+    if not key:
+        return False, ""
+    if len(key) > _MAX_LABEL_LEN or key[0] not in _LABEL_FIRST_CHARS:
+        return False, key  # laenger als jedes Label bzw. fremder Anfang
+    return (key in _LABELS_ALL) or (_compact(key) in _LABELS_COMPACT), key
 
 
 def _is_label_only_line(line: str) -> bool:
@@ -231,14 +314,18 @@ def _is_label_only_line(line: str) -> bool:
         "Vorname: Max"             â†’ False (hat bereits Wert)
         "Im lokalen Melderegister..." â†’ False (kein bekanntes Label)
         "Max Michael"                â†’ False (ein Wert, kein Label)
+
+    Duenner Wrapper um das memoisierte _classify_line — wiederholte
+    Klassifizierungen derselben Zeile kosten nur einen Dict-Lookup.
     """
-    key = _label_key_of(line)
-    if not key:
-        return False
-    return (key in _LABELS_NORM) or (_compact(key) in _LABELS_COMPACT)
+    return _classify_line(line)[0]
 
 
-def _matches_label_line(line: str, label_key_norm: str) -> bool:
+def _matches_label_line(
+    line: str,
+    label_key_norm: str,
+    label_key_compact: Optional[str] = None,
+) -> bool:
     """
     PrÃ¼ft, ob eine Zeile das gesuchte Label enthÃ¤lt.
 
@@ -248,8 +335,11 @@ def _matches_label_line(line: str, label_key_norm: str) -> bool:
         - OCR-Leerzeichen ("Familien name" â†’ compact "familienname")
 
     Parameter:
-        line:           Eine Zeile aus dem Meldezettel-Text
-        label_key_norm: Das gesuchte Label (bereits normalisiert)
+        line:              Eine Zeile aus dem Meldezettel-Text
+        label_key_norm:    Das gesuchte Label (bereits normalisiert)
+        label_key_compact: Optional die Compact-Form des Labels —
+                           Aufrufer in Schleifen (extract_value_after_label)
+                           berechnen sie EINMAL statt pro Zeile neu
 
     RÃ¼ckgabe:
         True wenn die Zeile das gesuchte Label enthÃ¤lt
@@ -263,22 +353,28 @@ def _matches_label_line(line: str, label_key_norm: str) -> bool:
     if not s:
         return False
 
-    # Nur den Teil VOR dem Doppelpunkt normalisieren (falls vorhanden)
-    if ":" in s:
-        left = s.split(":", 1)[0]
-        ln = normalize_for_matching(left)
-    else:
-        ln = normalize_for_matching(s)
+    # Nur den Teil VOR dem Doppelpunkt normalisieren (falls vorhanden);
+    # ohne Doppelpunkt liefert partition die ganze Zeile als left.
+    ln = normalize_for_matching(s.partition(":")[0])
 
     if not ln:
         return False
 
-    # Vier Vergleichsstrategien (von genau zu tolerant):
+    # Vier Vergleichsstrategien (von genau zu tolerant).
+    # Die Compact-Formen werden erst berechnet, wenn die beiden
+    # normalisierten Vergleiche nicht schon gewonnen haben — das ist
+    # der mit Abstand haeufigste Treffer-Pfad.
+    if ln == label_key_norm or label_key_norm in ln:
+        # Exakt: "vorname" == "vorname"
+        # Teilstring: "vorname" in "vorname und zweitname"
+        return True
+
+    if label_key_compact is None:
+        label_key_compact = _compact(label_key_norm)
+    ln_compact = _compact(ln)
     return (
-        ln == label_key_norm                                 # Exakt: "vorname" == "vorname"
-        or label_key_norm in ln                              # Teilstring: "vorname" in "vorname und zweitname"
-        or _compact(ln) == _compact(label_key_norm)          # Compact exakt: "vomame" == "vorname"? Nein, aber OCR: "vor name" == "vorname"
-        or _compact(label_key_norm) in _compact(ln)          # Compact Teilstring
+        ln_compact == label_key_compact      # Compact exakt: OCR "vor name" == "vorname"
+        or label_key_compact in ln_compact   # Compact Teilstring
     )
 
 
@@ -339,116 +435,301 @@ def extract_value_after_label(lines: list[str], label: str) -> Optional[str]:
         Der extrahierte Wert als String, oder None wenn nicht gefunden.
     """
     label_key = normalize_for_matching(label)
+    # Compact-Form EINMAL berechnen — nicht in _matches_label_line pro Zeile
+    label_key_compact = _compact(label_key)
 
-    for i, line in enumerate(lines):
-        if not line.strip():
+    # Jede Zeile EINMAL strippen: Der Scan unten prueft Leerheit, das
+    # Label-Matching strippt und die Block-Logik strippt — vorher je
+    # ein frischer str.strip() pro Zugriff.
+    stripped = [ln.strip() if ln else "" for ln in lines]
+
+    for i, line in enumerate(stripped):
+        if line and _matches_label_line(line, label_key, label_key_compact):
+            return _extract_value_at(stripped, i, label_key, label_key_compact)
+
+    # Label wurde im gesamten Text nicht gefunden
+    return None
+
+
+def extract_value_for_labels(lines: list[str], labels: tuple[str, ...]) -> Optional[str]:
+    """
+    Wie extract_value_after_label, aber fuer MEHRERE Kandidaten-Labels
+    in EINEM Durchlauf ueber die Zeilen.
+
+    Frueher rief extract_last_name_from_melde extract_value_after_label
+    bis zu dreimal auf — drei komplette Zeilen-Scans pro Dokument.
+    Hier wird pro Label nur die erste Treffer-Zeile gemerkt (ein Scan),
+    danach werden die Labels in Prioritaets-Reihenfolge aufgeloest:
+    Das erste Label mit Treffer-Zeile UND extrahierbarem Wert gewinnt —
+    exakt die Semantik der frueheren Aufruf-Kaskade.
+
+    Parameter:
+        lines:  Liste von Textzeilen (text.splitlines())
+        labels: Kandidaten-Labels, spezifischstes zuerst
+
+    Rueckgabe:
+        Wert des hoechstprioren treffenden Labels, oder None.
+    """
+    keys = []
+    for lb in labels:
+        lk = normalize_for_matching(lb)
+        keys.append((lk, _compact(lk)))
+    stripped = [ln.strip() if ln else "" for ln in lines]
+
+    first_idx: dict[int, int] = {}   # Label-Position -> erste Treffer-Zeile
+    remaining = len(keys)
+    for i, line in enumerate(stripped):
+        if not line:
             continue
+        for j, (lk, lkc) in enumerate(keys):
+            if j not in first_idx and _matches_label_line(line, lk, lkc):
+                first_idx[j] = i
+                remaining -= 1
+        if not remaining:
+            break
+
+    for j, (lk, lkc) in enumerate(keys):
+        i = first_idx.get(j)
+        if i is not None:
+            v = _extract_value_at(stripped, i, lk, lkc)
+            if v:
+                return v
+    return None
 
-        # Ist diese Zeile unser gesuchtes Label?
-        if _matches_label_line(line, label_key):
-
-            # â”€â”€ Layout A: Wert rechts vom ":" â”€â”€
-            # "Vorname: Max Michael"  â†’ right = "Max Michael"
-            if ":" in line:
-                right = line.split(":", 1)[1].strip()
-                if right:
-                    return right
-
-            # â”€â”€ Layout A2: Inline ohne Doppelpunkt (Linz) â”€â”€
-            # "Vorname                Max"
-            # Kein ":" vorhanden â†’ Splitten an 2+ Leerzeichen.
-            # Das erste Teil ist das Label, das zweite der Wert.
-            #
-            # Wichtig: Der Wert darf KEIN weiteres Label sein!
-            # Sonst wÃ¼rde "Familienname                Vorname" den
-            # Wert "Vorname" zurÃ¼ckgeben (was falsch wÃ¤re).
-            if ":" not in line:
-                parts = re.split(r'\s{2,}', line.strip(), maxsplit=1)
-                if len(parts) == 2:
-                    potential_value = parts[1].strip()
-                    if potential_value and not _is_label_only_line(potential_value):
-                        return potential_value
-
-            # â”€â”€ NÃ¤chste nicht-leere Zeile suchen â”€â”€
-            # FÃ¼r Layout B und C brauchen wir die Folgezeile(n).
-            k = i + 1
-            while k < len(lines) and not lines[k].strip():
-                k += 1
-            if k >= len(lines):
-                return None
-
-            # â”€â”€ Layout B: Wert auf der nÃ¤chsten Zeile â”€â”€
-            # "Vorname:"      â† Label
-            # "Max Michael"  â† Wert (kein Label-only)
-            if not _is_label_only_line(lines[k]):
-                return lines[k].strip()
-
-            # â”€â”€ Layout C: Block-Layout â”€â”€
-            # Die nÃ¤chste Zeile ist AUCH ein Label â†’ wir sind in einem Label-Block.
-            # Strategie:
-            #   1) Label-Block nach oben erweitern (alle zusammenhÃ¤ngenden Labels)
-            #   2) Index unseres Labels im Block bestimmen
-            #   3) Werte-Block (nach den Labels) lesen
-            #   4) Wert an der gleichen Position zurÃ¼ckgeben
-
-            # Schritt 1: Start des Label-Blocks nach oben suchen
-            # Wir gehen von der aktuellen Zeile rÃ¼ckwÃ¤rts, solange Labels kommen.
-            start = i
-            while start - 1 >= 0 and _is_label_only_line(lines[start - 1]):
-                start -= 1
-
-            # Schritt 2: Alle Labels im Block sammeln (vorwÃ¤rts ab start)
-            labels: list[str] = []
-            end = start
-            while end < len(lines):
-                cur = lines[end].strip()
-                if not cur:
-                    end += 1        # Leere Zeilen Ã¼berspringen
-                    continue
-                if _is_label_only_line(cur):
-                    labels.append(_label_key_of(cur))
-                    end += 1
-                    continue
-                break  # Erste Nicht-Label-Zeile â†’ Werteblock beginnt hier
 
-            if not labels:
-                return None
+def _extract_value_at(
+    stripped: list[str],
+    i: int,
+    label_key: str,
+    label_key_compact: str,
+) -> Optional[str]:
+    """
+    Extrahiert den Wert fuer das Label in Zeile i (Zeilen bereits gestrippt).
+
+    Probiert die Layouts in der Reihenfolge A -> A2 -> B -> C durch
+    (Layout-Beschreibung siehe extract_value_after_label).
+    """
+    n = len(stripped)
+    line = stripped[i]
+
+    # ── Layout A: Wert rechts vom ":" ──
+    # "Vorname: Max Michael"  → right = "Max Michael"
+    if ":" in line:
+        right = line.split(":", 1)[1].strip()
+        if right:
+            return right
+
+    # ── Layout A2: Inline ohne Doppelpunkt (Linz) ──
+    # "Vorname                Max"
+    # Kein ":" vorhanden → Splitten an 2+ Leerzeichen.
+    # Das erste Teil ist das Label, das zweite der Wert.
+    #
+    # Wichtig: Der Wert darf KEIN weiteres Label sein!
+    # Sonst wuerde "Familienname                Vorname" den
+    # Wert "Vorname" zurueckgeben (was falsch waere).
+    if ":" not in line:
+        parts = _RE_COLS.split(line, maxsplit=1)
+        if len(parts) == 2:
+            potential_value = parts[1].strip()
+            if potential_value and not _is_label_only_line(potential_value):
+                return potential_value
+
+    # ── Naechste nicht-leere Zeile suchen ──
+    # Fuer Layout B und C brauchen wir die Folgezeile(n).
+    k = i + 1
+    while k < n and not stripped[k]:
+        k += 1
+    if k >= n:
+        return None
 
-            # Schritt 3: Index unseres Labels im Label-Block finden
-            # (auch mit Compact-Matching fÃ¼r OCR-Robustheit)
-            idx: Optional[int] = None
-            for pos, lab in enumerate(labels):
+    # ── Layout B: Wert auf der naechsten Zeile ──
+    # "Vorname:"      ← Label
+    # "Max Michael"  ← Wert (kein Label-only)
+    if not _is_label_only_line(stripped[k]):
+        return stripped[k]
+
+    # ── Layout C: Block-Layout ──
+    # Die naechste Zeile ist AUCH ein Label → wir sind in einem Label-Block.
+    # Strategie:
+    #   1) Label-Block nach oben erweitern (alle zusammenhaengenden Labels)
+    #   2) Index unseres Labels im Block bestimmen
+    #   3) Werte-Block (nach den Labels) lesen
+    #   4) Wert an der gleichen Position zurueckgeben
+
+    # Schritt 1: Start des Label-Blocks nach oben suchen
+    # Wir gehen von der aktuellen Zeile rueckwaerts, solange Labels kommen.
+    start = i
+    while start - 1 >= 0 and _is_label_only_line(stripped[start - 1]):
+        start -= 1
+
+    # Schritt 2: Alle Labels im Block sammeln (vorwaerts ab start)
+    labels: list[str] = []
+    end = start
+    while end < n:
+        cur = stripped[end]
+        if not cur:
+            end += 1        # Leere Zeilen ueberspringen
+            continue
+        is_lab, lab_key = _classify_line(cur)
+        if is_lab:
+            labels.append(lab_key)
+            end += 1
+            continue
+        break  # Erste Nicht-Label-Zeile → Werteblock beginnt hier
+
+    if not labels:
+        return None
+
+    # Schritt 3: Index unseres Labels im Label-Block finden
+    # (auch mit Compact-Matching fuer OCR-Robustheit)
+    idx: Optional[int] = None
+    for pos, lab in enumerate(labels):
+        # Compact-Form nur berechnen, wenn der normalisierte
+        # Vergleich nicht schon gewinnt (wie ueberall sonst).
+        # Ein Dict-Lookup statt der Schleife wuerde bei sich
+        # ueberlappenden Labels ("familienname" exakt vs.
+        # "familienname oder nachname" frueher im Block) eine
+        # andere Spalte waehlen — der Block ist ohnehin klein.
+        if lab == label_key or label_key in lab:
+            idx = pos
+            break
+        lab_compact = _compact(lab)
+        if lab_compact == label_key_compact or label_key_compact in lab_compact:
+            idx = pos
+            break
+
+    if idx is None:
+        return None
+
+    # Schritt 4: Werte sammeln (ab end) und idx-ten Wert zurueckgeben
+    # Der Werteblock beginnt bei 'end' (erste Nicht-Label-Zeile).
+    # Wir sammeln Werte, bis wir genug haben (idx + 1 Stueck).
+    values: list[str] = []
+    p = end
+    while p < n and len(values) <= idx:
+        v = stripped[p]
+        if v:
+            # Sicherheitsnetz: Falls im Werteblock doch ein Label auftaucht
+            # (unerwartetes Layout), ueberspringen wir es.
+            if _is_label_only_line(v):
+                p += 1
+                continue
+            values.append(v)
+        p += 1
+
+    return values[idx] if len(values) > idx else None
+
+
+# â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
+# 1d) SINGLE-PASS LABEL/WERT-TABELLE
+# â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
+#
+# validate_meldezettel() fragt 3-5 Labels ab; extract_value_after_label()
+# laeuft dafuer jedes Mal ueber ALLE Zeilen (O(Labels x Zeilen)).
+# _parse_label_value_blocks() baut stattdessen in EINEM Durchlauf eine
+# flache Tabelle {label_key_norm: wert}, aus der alle Abfragen bedient
+# werden (O(Zeilen) + O(Labels x Tabellengroesse), Tabelle ~5-10 Eintraege).
+#
+# Die Tabelle behaelt Dokument-Reihenfolge (dict = Insertion Order) und
+# pro Label den ERSTEN Treffer — wie die sequentielle Suche.
+# Fuer Layout C ordnet sie Label- und Werte-Bloecke POSITIONell zu
+# (1. Label -> 1. Wert), wie im Modul-Docstring beschrieben.
+
+def _parse_label_value_blocks(lines: list[str]) -> dict[str, str]:
+    """
+    Scannt die Zeilen EINMAL und ordnet jedem bekannten Label seinen Wert zu.
+
+    Erkennt dieselben Layouts wie extract_value_after_label():
+        Layout A:  "Vorname: Max"             -> inline rechts vom ":"
+        Layout A2: "Vorname         Max"      -> inline nach 2+ Leerzeichen
+        Layout B:  "Vorname:" / "Max"         -> Wert auf Folgezeile
+        Layout C:  Label-Block / Werte-Block  -> positionelle Zuordnung
+
+    Rueckgabe:
+        {label_key_norm: wert} — pro Label der erste gefundene Wert.
+    """
+    mapping: dict[str, str] = {}
+    pending: list[str] = []         # Label-only-Zeilen, warten auf Werte
+    pending_values: list[str] = []  # Werte-Block zu den pending-Labels
+
+    def _flush() -> None:
+        # Labels und Werte positionell zusammenfuehren (zip bricht am
+        # kuerzeren Block ab — ueberzaehlige Labels bleiben ohne Wert).
+        for k, v in zip(pending, pending_values):
+            mapping.setdefault(k, v)
+        pending.clear()
+        pending_values.clear()
+
+    for raw in lines:
+        s = raw.strip()
+        if not s:
+            continue
+
+        # Reines Label ("Vorname:" oder Linz-"Vorname") -> Block-Kandidat.
+        # _classify_line akzeptiert NUR bekannte Labels (siehe dort).
+        is_lab, lab_key = _classify_line(s)
+        if is_lab:
+            if pending_values:
+                _flush()
+            pending.append(lab_key)
+            continue
+
+        # Layout A: "Vorname: Max" — Wert inline rechts vom ":"
+        if ":" in s:
+            left, right = s.split(":", 1)
+            right = right.strip()
+            if right:
+                _flush()
+                key = normalize_for_matching(left)
+                if key:
+                    mapping.setdefault(key, right)
+                continue
+            # "Irgendwas:" mit UNbekanntem Label faellt durch zur
+            # Wert-Logik (die sequentielle Suche behandelt das genauso).
+
+        # Layout A2: "Vorname         Max" (2+ Leerzeichen als Trenner)
+        if ":" not in s:
+            parts = _RE_COLS.split(s, maxsplit=1)
+            if len(parts) == 2:
+                k2 = normalize_for_matching(parts[0])
+                val = parts[1].strip()
                 if (
-                    lab == label_key
-                    or label_key in lab
-                    or _compact(lab) == _compact(label_key)
-                    or _compact(label_key) in _compact(lab)
+                    val
+                    and (k2 in _LABELS_ALL or _compact(k2) in _LABELS_COMPACT)
+                    and not _is_label_only_line(val)
                 ):
-                    idx = pos
-                    break
-
-            if idx is None:
-                return None
-
-            # Schritt 4: Werte sammeln (ab end) und idx-ten Wert zurÃ¼ckgeben
-            # Der Werteblock beginnt bei 'end' (erste Nicht-Label-Zeile).
-            # Wir sammeln Werte, bis wir genug haben (idx + 1 StÃ¼ck).
-            values: list[str] = []
-            p = end
-            while p < len(lines) and len(values) <= idx:
-                v = lines[p].strip()
-                if v:
-                    # Sicherheitsnetz: Falls im Werteblock doch ein Label auftaucht
-                    # (unerwartetes Layout), Ã¼berspringen wir es.
-                    if _is_label_only_line(v):
-                        p += 1
-                        continue
-                    values.append(v)
-                p += 1
+                    _flush()
+                    mapping.setdefault(k2, val)
+                    continue
 
-            return values[idx] if len(values) > idx else None
+        # Normale Wert-Zeile: gehoert zum offenen Label-Block (falls einer
+        # offen ist), sonst freier Text (Adresse, Fusszeile, ...).
+        if pending:
+            pending_values.append(s)
+            if len(pending_values) == len(pending):
+                _flush()
 
-    # Label wurde im gesamten Text nicht gefunden
+    _flush()
+    return mapping
+
+
+def _lookup_label(mapping: dict[str, str], label: str) -> Optional[str]:
+    """
+    Sucht ein Label in der Tabelle von _parse_label_value_blocks().
+
+    Verwendet dieselbe Vergleichsleiter wie _matches_label_line()
+    (exakt -> Teilstring -> compact), in Dokument-Reihenfolge.
+    """
+    label_key = normalize_for_matching(label)
+    label_key_compact = _compact(label_key)
+    for k, v in mapping.items():
+        # Compact-Form erst berechnen, wenn der normalisierte Vergleich
+        # nicht schon gewonnen hat (wie in _matches_label_line)
+        if k == label_key or label_key in k:
+            return v
+        kc = _compact(k)
+        if kc == label_key_compact or label_key_compact in kc:
+            return v
     return None
 
 
@@ -460,20 +741,32 @@ def extract_value_after_label(lines: list[str], label: str) -> Optional[str]:
 # die spezifischen Felder aufrufen. Sie kapseln die Label-Varianten
 # und Nachbearbeitung (z.B. Geburtsdatum-Normalisierung).
 
-def extract_first_name_from_melde(text: str) -> Optional[str]:
+def extract_first_name_from_melde(
+    text: str, lines: Optional[list[str]] = None
+) -> Optional[str]:
     """
     Extrahiert den Vornamen aus einem Meldezettel-Text.
 
     Sucht nach dem Label "Vorname" (oder OCR-Variante "Vomame").
 
+    Parameter:
+        text:  Meldezettel-Text
+        lines: Optional bereits gesplittete Zeilen (text.splitlines()) —
+               validate_meldezettel() splittet den Text EINMAL und reicht
+               die Liste an alle vier Extraktionen weiter, statt dass
+               jede den (bei OCR oft langen) Text neu splittet.
+
     RÃ¼ckgabe:
         Der Vorname als String (z.B. "Max Michael"), oder None.
     """
-    lines = text.splitlines()
+    if lines is None:
+        lines = text.splitlines()
     return extract_value_after_label(lines, "Vorname")
 
 
-def extract_last_name_from_melde(text: str) -> Optional[str]:
+def extract_last_name_from_melde(
+    text: str, lines: Optional[list[str]] = None
+) -> Optional[str]:
     """
     Extrahiert den Nachnamen aus einem Meldezettel-Text.
 
@@ -488,12 +781,13 @@ def extract_last_name_from_melde(text: str) -> Optional[str]:
     RÃ¼ckgabe:
         Der Nachname als String (z.B. "Mustermann"), oder None.
     """
-    lines = text.splitlines()
-    for lbl in ("Familienname oder Nachname", "Familienname", "Nachname"):
-        v = extract_value_after_label(lines, lbl)
-        if v:
-            return v
-    return None
+    if lines is None:
+        lines = text.splitlines()
+    # Ein Durchlauf fuer alle drei Label-Varianten statt bis zu drei
+    # kompletter Zeilen-Scans (siehe extract_value_for_labels).
+    return extract_value_for_labels(
+        lines, ("Familienname oder Nachname", "Familienname", "Nachname")
+    )
 
 
 def normalize_birthdate(value: str) -> Optional[str]:
@@ -528,39 +822,65 @@ def normalize_birthdate(value: str) -> Optional[str]:
 
     v = (value or "").strip()
 
-    # OCR-Bereinigung: Leerzeichen entfernen, Kommas zu Punkten
-    v = v.replace(" ", "").replace(",", ".")
-
-    # OCR-Fehler: O/o â†’ 0 (zwischen Ziffern)
-    # "O1.O6.1985" â†’ "01.06.1985"
-    v = re.sub(r"(?<=\d)[Oo](?=\d)", "0", v)
+    # Komplette OCR-Bereinigung in EINEM C-Level-Durchlauf:
+    # Leerzeichen raus, Kommas zu Punkten, O/o -> 0, l/I -> 1.
+    # (Frueher: zwei replace()-Aufrufe plus zwei Regex-Substitutionen,
+    # also vier Durchlaeufe mit je einer String-Allokation.)
+    v = v.translate(_DATE_TRANS)
+
+    # Fast Path: kanonische 10-Zeichen-Formate direkt per Slicing,
+    # ganz ohne Regex — deckt die beiden haeufigsten Faelle ab:
+    #   "01.06.1985"  (deutsch)
+    #   "1985-06-15" / "1985.06.15"  (ISO)
+    # Bei gemischten Trennern o.ae. faellt der Code auf das
+    # Token-Parsing darunter zurueck.
+    if len(v) == 10:
+        try:
+            if v[2] == "." and v[5] == ".":
+                return date(int(v[6:10]), int(v[3:5]), int(v[0:2])).isoformat()
+            if v[4] in ".-" and v[7] == v[4]:
+                return date(int(v[0:4]), int(v[5:7]), int(v[8:10])).isoformat()
+        except ValueError:
+            return None    # z.B. "31.02.1990" — Kalender-Validierung
+
+    # Direktes Token-Parsing statt fromisoformat/strptime-Kaskade.
+    #
+    # strptime ist teuer (Format-String wird bei jedem Aufruf zerlegt)
+    # und die alte Kaskade hat auf dem haeufigsten Pfad (deutsches
+    # Format "01.06.1985") erst ZWEI ValueErrors geworfen, bevor das
+    # dritte Format passte. Stattdessen: Ziffern-Tokens einsammeln und
+    # an der Position des 4-stelligen Jahres erkennen, was gemeint ist:
+    #
+    #   "1985.06.15" / "1985-06-15"  -> Jahr vorne  -> Y, M, D
+    #   "01.06.1985"                 -> Jahr hinten -> D, M, Y
+    #   "1990-01-01T00:00:00"        -> Jahr vorne, Zeit-Tokens ignoriert
+    #
+    # date(y, m, d) validiert den Kalender (Monat 1-12, Schalttage, ...)
+    # genauso wie strptime — nur ohne dessen Overhead.
+    if _RE_DATE_JUNK.search(v):
+        return None    # unreparierte Fremdzeichen -> kein Datum
+
+    tokens = [t for t in _RE_NON_DIGIT.split(v) if t]
+    if len(tokens) < 3:
+        return None
 
-    # OCR-Fehler: l/I â†’ 1 (zwischen Ziffern)
-    # "l5.06.1985" â†’ "15.06.1985"
-    v = re.sub(r"(?<=\d)[lI](?=\d)", "1", v)
+    t1, t2, t3 = tokens[0], tokens[1], tokens[2]
+    if len(t1) == 4:
+        y, m, d = int(t1), int(t2), int(t3)
+    elif len(t3) == 4:
+        d, m, y = int(t1), int(t2), int(t3)
+    else:
+        return None    # kein 4-stelliges Jahr erkennbar
 
-    # Versuch 1: ISO-Parsing (inkl. Uhrzeit)
-    # fromisoformat versteht: "1990-01-01", "1990-01-01T00:00:00"
     try:
-        dt = datetime.fromisoformat(v)
-        return dt.date().isoformat()
+        return date(y, m, d).isoformat()
     except ValueError:
-        pass
-
-    # Versuch 2: Explizite Formate
-    # Reihenfolge wichtig: YYYY-MM-DD vor DD.MM.YYYY
-    # (sonst wird "1990-01-15" falsch geparst)
-    for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%d.%m.%Y"):
-        try:
-            dt2 = datetime.strptime(v, fmt).date()
-            return dt2.isoformat()
-        except ValueError:
-            continue
-
-    return None
+        return None
 
 
-def extract_birthdate_from_melde(text: str) -> Optional[str]:
+def extract_birthdate_from_melde(
+    text: str, lines: Optional[list[str]] = None
+) -> Optional[str]:
     """
     Extrahiert und normalisiert das Geburtsdatum aus einem Meldezettel.
 
@@ -576,12 +896,15 @@ def extract_birthdate_from_melde(text: str) -> Optional[str]:
         â†’ extract_value_after_label â†’ "01.01.1990"
         â†’ normalize_birthdate â†’ "1990-01-01"
     """
-    lines = text.splitlines()
+    if lines is None:
+        lines = text.splitlines()
     raw = extract_value_after_label(lines, "Geburtsdatum")
     return normalize_birthdate(raw) if raw else None
 
 
-def extract_current_main_residence_postal_code(text: str) -> Optional[str]:
+def extract_current_main_residence_postal_code(
+    text: str, lines: Optional[list[str]] = None
+) -> Optional[str]:
     """
     Extrahiert die PLZ des Hauptwohnsitzes aus einem Meldezettel.
 
@@ -610,14 +933,30 @@ def extract_current_main_residence_postal_code(text: str) -> Optional[str]:
     RÃ¼ckgabe:
         4-stellige PLZ als String (z.B. "5020"), oder None.
     """
-    lines = text.splitlines()
+    if lines is None:
+        lines = text.splitlines()
 
     # Schritt 1: Zeile mit "Hauptwohnsitz" finden
-    start_idx = None
+    #
+    # Zweistufig: Erst ein billiger lower()-Teilstring-Test pro Zeile
+    # (C-Level-Suche, kein Regex). Nur die Zeilen VOR dem schnellen
+    # Treffer muessen noch normalisiert geprueft werden — dort koennte
+    # eine OCR-Variante stehen (z.B. Diakritika im Wort), die der
+    # lower()-Test nicht sieht. Eine Zeile, die den lower()-Test
+    # besteht, besteht immer auch den normalisierten Test, daher ist
+    # das Ergebnis identisch zum frueheren reinen normalize-Scan.
+    fast_idx = None
     for i, line in enumerate(lines):
+        if "hauptwohnsitz" in line.lower():
+            fast_idx = i
+            break
+
+    start_idx = fast_idx
+    scan_upto = fast_idx if fast_idx is not None else len(lines)
+    for i in range(scan_upto):
         # Normalisiert suchen: "Hauptwohnsitz" â†’ "hauptwohnsitz"
-        # Auch: "HAUPTWOHNSITZ", "Hauptwohn sitz" (OCR) werden gefunden
-        if "hauptwohnsitz" in normalize_for_matching(line):
+        # Auch: "HAUPTWOHNSITZ", OCR-Diakritika werden gefunden
+        if "hauptwohnsitz" in normalize_for_matching(lines[i]):
             start_idx = i
             break
 
@@ -630,12 +969,13 @@ def extract_current_main_residence_postal_code(text: str) -> Optional[str]:
     #   oder
     #   "Hauptwohnsitz
     #    5020 Salzburg"
-    for line in lines[start_idx:]:
-        match = re.search(r"\b\d{4}\b", line)
-        if match:
-            return match.group(0)
-
-    return None
+    #
+    # EIN Regex-Lauf ueber den zusammengefuegten Rest statt eines
+    # re.search-Aufrufs pro Zeile: Die Regex-Engine laeuft in C ueber
+    # den Text, und \b behandelt das eingefuegte \n als Wortgrenze —
+    # die Treffer sind identisch zum frueheren Zeilen-Loop.
+    match = _RE_PLZ.search("\n".join(lines[start_idx:]))
+    return match.group(0) if match else None
 
 
 # =============================================================================
@@ -687,20 +1027,28 @@ def first_name_matches(form_vorname: str, melde_vorname: Optional[str]) -> bool:
     # Nur den ERSTEN Vornamen verwenden (Rufname)
     f_first = f_norm.split()[0]
 
+    # Abgeleitete Formen von m_norm EINMAL berechnen — Ebene 1 bis 3
+    # vergleichen alle gegen dieselben Tokens bzw. dieselbe Compact-Form
+    # (vorher wurden Set und Compact-Form pro Variante neu gebaut).
+    m_tokens = set(m_norm.split())
+    m_compact = _compact(m_norm)
+
     # â”€â”€ Ebene 1: Token-Match â”€â”€
     # "max" in {"max", "michael"} â†’ True
-    if f_first in set(m_norm.split()):
+    if f_first in m_tokens:
         return True
 
     # â”€â”€ Ebene 2: Compact-Match (OCR) â”€â”€
     # "max" in "maxmichael" â†’ True
-    if _compact(f_first) in _compact(m_norm):
+    if _compact(f_first) in m_compact:
         return True
 
     # â”€â”€ Ebene 3: Umlaut-Varianten â”€â”€
     # "jurgen" â†’ Varianten: ["juergen", "jurgen"] â†’ prÃ¼fe alle
+    # Die unveraenderte Variante (v == f_first) haben Ebene 1 + 2
+    # bereits geprueft — nur echte Transliterationen testen.
     for v in _variants_for_umlaut_translit(f_first):
-        if v in set(m_norm.split()) or _compact(v) in _compact(m_norm):
+        if v != f_first and (v in m_tokens or _compact(v) in m_compact):
             return True
 
     return False
@@ -753,19 +1101,26 @@ def last_name_matches(form_nachname: str, melde_nachname: Optional[str]) -> bool
 
     # â”€â”€ Ebene 2: Doppelname-Logik â”€â”€
     # Antrag: "Muster Beispiel" â†’ Tokens: ["muster", "beispiel"]
-    # Beide mÃ¼ssen im Meldezettel vorkommen (Reihenfolge egal)
+    # Beide mÃ¼ssen im Meldezettel vorkommen (Reihenfolge egal).
+    # Nur fuer MEHRTEILIGE Antragsnamen noetig: Ein einzelnes Token,
+    # das als Token in m_norm vorkommt, ist immer auch ein Teilstring
+    # von m_norm — das hat Ebene 1 bereits abgedeckt.
     f_tokens = f_norm.split()
-    m_tokens = set(m_norm.split())
-    if f_tokens and all(t in m_tokens for t in f_tokens):
+    if len(f_tokens) > 1 and frozenset(f_tokens).issubset(m_norm.split()):
         return True
 
+    # Compact-Form von m_norm EINMAL berechnen (Ebene 3 + 4)
+    m_compact = _compact(m_norm)
+
     # â”€â”€ Ebene 3: Compact-Match (OCR) â”€â”€
-    if _compact(f_norm) in _compact(m_norm):
+    if _compact(f_norm) in m_compact:
         return True
 
     # â”€â”€ Ebene 4: Umlaut-Varianten â”€â”€
+    # Die unveraenderte Variante (v == f_norm) hat Ebene 3 bereits
+    # geprueft — nur echte Transliterationen testen.
     for v in _variants_for_umlaut_translit(f_norm):
-        if _compact(v) in _compact(m_norm):
+        if v != f_norm and _compact(v) in m_compact:
             return True
 
     return False
@@ -813,7 +1168,7 @@ def birthdate_matches(form_date: str, melde_date_iso: Optional[str]) -> tuple[bo
 # Diese Menge muss aktualisiert werden, wenn sich die FÃ¶rderbedingungen Ã¤ndern
 # oder neue PLZ hinzukommen.
 
-SALZBURG_PLZ = {
+SALZBURG_PLZ = frozenset({
     "5010",    # Salzburg (Altstadt, Zentrum)
     "5014",    # Salzburg (Leopoldskron-Moos)
     "5017",    # Salzburg (MÃ¼lln, Maxglan)
@@ -824,7 +1179,13 @@ SALZBURG_PLZ = {
     "5026",    # Salzburg (Salzburg-SÃ¼d)
     "5027",    # Salzburg (Berchtesgadner StraÃŸe)
     "5033",    # Salzburg (Langwied, Kasern)
-}
+})
+
+# Integer-Spiegel der Menge fuer den Lookup im Hot Path:
+# int-Hashing ist (fast) Identitaet, String-Hashing muss die vier
+# Zeichen durchlaufen. Die Laengen-/isdigit-Schranke in der Funktion
+# verwirft Nicht-PLZ-Eingaben ganz ohne Hash.
+_SALZBURG_PLZ_INTS: frozenset[int] = frozenset(int(p) for p in SALZBURG_PLZ)
 
 
 def is_postcode_foerderberechtigt(plz: str) -> bool:
@@ -842,7 +1203,10 @@ def is_postcode_foerderberechtigt(plz: str) -> bool:
         is_postcode_foerderberechtigt("4020") â†’ False (Linz)
         is_postcode_foerderberechtigt("")     â†’ False (leer)
     """
-    return (plz or "").strip() in SALZBURG_PLZ
+    s = plz.strip() if plz else ""
+    if len(s) != 4 or not s.isdigit():
+        return False
+    return int(s) in _SALZBURG_PLZ_INTS
 
 
 # =============================================================================
@@ -857,6 +1221,56 @@ def is_postcode_foerderberechtigt(plz: str) -> bool:
 # Sie fÃ¼hrt alle vier PrÃ¼fungen durch und gibt ein strukturiertes
 # Ergebnis-Dict zurÃ¼ck.
 
+@lru_cache(maxsize=256)
+def _parse_meldezettel(
+    melde_text: str,
+) -> tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """
+    Extrahiert die vier Felder eines Meldezettels in einem Durchgang.
+
+    Der Text wird EINMAL gesplittet und EINMAL zu einer Label/Wert-
+    Tabelle geparst (siehe _parse_label_value_blocks); die Label-
+    Abfragen sind dann Lookups in der kleinen Tabelle statt jeweils
+    ein kompletter Zeilen-Scan. Liefert die Tabelle nichts, greift
+    als Fallback die sequentielle Suche (extract_*_from_melde).
+
+    Memoisiert (lru_cache): Wird derselbe Meldezettel-Text mehrfach
+    validiert (UI-Rerun, mehrere Antragszeilen), entfaellt das
+    erneute Parsen komplett. maxsize=256 begrenzt den Speicher,
+    da die Texte (OCR) gross sein koennen.
+
+    Rueckgabe:
+        (vorname_full, nachname, geburtsdatum_iso, plz) — jeweils
+        String oder None.
+    """
+    lines = melde_text.splitlines()
+    table = _parse_label_value_blocks(lines)
+
+    vorname_full = _lookup_label(table, "Vorname")  # z.B. "Max Michael"
+    if not vorname_full:
+        vorname_full = extract_first_name_from_melde(melde_text, lines)
+
+    nachname = None  # z.B. "Mustermann"
+    for lbl in ("Familienname oder Nachname", "Familienname", "Nachname"):
+        nachname = _lookup_label(table, lbl)
+        if nachname:
+            break
+    if not nachname:
+        nachname = extract_last_name_from_melde(melde_text, lines)
+
+    raw_geb = _lookup_label(table, "Geburtsdatum")
+    geburtsdatum_iso = (  # z.B. "1990-01-01"
+        normalize_birthdate(raw_geb)
+        if raw_geb
+        else extract_birthdate_from_melde(melde_text, lines)
+    )
+
+    # PLZ ist nicht label-basiert (Abschnitts-Heuristik).
+    plz = extract_current_main_residence_postal_code(melde_text, lines)  # z.B. "5020"
+
+    return vorname_full, nachname, geburtsdatum_iso, plz
+
+
 def validate_meldezettel(form_data: dict, melde_text: str, verbose: bool = False) -> Dict[str, Any]:
     """
     Validiert einen Meldezettel gegen Antragsdaten.
@@ -876,7 +1290,8 @@ def validate_meldezettel(form_data: dict, melde_text: str, verbose: bool = False
         form_data:  Dict mit Antragsdaten. Erwartete Keys:
                     "vorname", "familienname", "geburtsdatum", "plz"
         melde_text: Extrahierter Text aus dem Meldezettel-PDF
-        verbose:    Debug-Ausgaben auf Konsole? (Default: False)
+        verbose:    Nur noch aus KompatibilitaetsgrÃ¼nden in der Signatur.
+                    Debug-Ausgaben laufen Ã¼ber logging (LOGLEVEL=DEBUG).
 
     RÃ¼ckgabe (dict):
         doc_type:    "meldezettel"
@@ -917,11 +1332,15 @@ def validate_meldezettel(form_data: dict, melde_text: str, verbose: bool = False
     """
 
     # â”€â”€ 1) Felder aus Meldezettel extrahieren â”€â”€
-    # Jede Funktion sucht das entsprechende Label und gibt den Wert zurÃ¼ck.
-    melde_vorname_full = extract_first_name_from_melde(melde_text)     # z.B. "Max Michael"
-    melde_nachname = extract_last_name_from_melde(melde_text)          # z.B. "Mustermann"
-    melde_geburtsdatum_iso = extract_birthdate_from_melde(melde_text)  # z.B. "1990-01-01"
-    current_plz = extract_current_main_residence_postal_code(melde_text)  # z.B. "5020"
+    # Gesamtes Parsen (Split, Label/Wert-Tabelle, Fallback-Suche) lebt
+    # in _parse_meldezettel und ist pro Text memoisiert — hier bleiben
+    # nur noch die billigen Vergleiche gegen die Antragsdaten.
+    (
+        melde_vorname_full,      # z.B. "Max Michael"
+        melde_nachname,          # z.B. "Mustermann"
+        melde_geburtsdatum_iso,  # z.B. "1990-01-01"
+        current_plz,             # z.B. "5020"
+    ) = _parse_meldezettel(melde_text)
 
     # â”€â”€ 2) Vorname prÃ¼fen â”€â”€
     vorname_ok = first_name_matches(
@@ -943,7 +1362,8 @@ def validate_meldezettel(form_data: dict, melde_text: str, verbose: bool = False
     )
 
     # â”€â”€ 5) PLZ prÃ¼fen (zwei TeilprÃ¼fungen) â”€â”€
-    current_plz = extract_current_main_residence_postal_code(melde_text)
+    # current_plz wurde bereits in Schritt 1 extrahiert (frueher stand
+    # hier ein zweiter, identischer Extraktions-Aufruf).
     form_plz = (form_data.get("plz") or "").strip()
 
     # TeilprÃ¼fung 1: Ist die Meldezettel-PLZ eine Salzburger PLZ?
@@ -975,32 +1395,40 @@ def validate_meldezettel(form_data: dict, melde_text: str, verbose: bool = False
         },
 
         # Einzelergebnisse jeder PrÃ¼fung
+        # (keine bool()-Wrapper mehr: die Matcher liefern bereits
+        # echte bools, die Coercion war nur Allokations-Ballast)
         "checks": {
-            "vorname_ok": bool(vorname_ok),
-            "nachname_ok": bool(nachname_ok),
-            "geburtsdatum_ok": bool(geburtsdatum_ok),
-            "plz_ok": bool(plz_ok),              # Gesamt-PLZ (beide Teile)
-            "plz_ok_melde": bool(plz_ok_melde),  # PLZ fÃ¶rderberechtigt?
-            "plz_ok_form": bool(plz_ok_form),    # PLZ Antrag == Meldezettel?
+            "vorname_ok": vorname_ok,
+            "nachname_ok": nachname_ok,
+            "geburtsdatum_ok": geburtsdatum_ok,
+            "plz_ok": plz_ok,              # Gesamt-PLZ (beide Teile)
+            "plz_ok_melde": plz_ok_melde,  # PLZ fÃ¶rderberechtigt?
+            "plz_ok_form": plz_ok_form,    # PLZ Antrag == Meldezettel?
         },
 
         # Gesamtergebnis: Alle vier HauptprÃ¼fungen mÃ¼ssen bestehen
-        "all_ok": bool(vorname_ok and nachname_ok and geburtsdatum_ok and plz_ok),
+        "all_ok": vorname_ok and nachname_ok and geburtsdatum_ok and plz_ok,
     }
 
     # â”€â”€ 7) Debug-Ausgaben â”€â”€
-    if verbose:
-        print("Vorname-Match:", result["checks"]["vorname_ok"])
-        print("Nachname-Match:", result["checks"]["nachname_ok"])
-        print("Geburtsdatum-Match:", result["checks"]["geburtsdatum_ok"])
-        print("PLZ fÃ¶rderberechtigt:", result["checks"]["plz_ok"])
-
-        print("DEBUG melde_nachname:", melde_nachname)
-        print("DEBUG melde_vorname_full:", melde_vorname_full)
-        print("DEBUG melde_geburtsdatum_iso:", melde_geburtsdatum_iso)
-        print("DEBUG form_geburtsdatum_iso:", form_geburtsdatum_iso)
-        print("PLZ (Meldezettel) fÃ¶rderberechtigt:", plz_ok_melde)
-        print("PLZ Formular = PLZ Meldezettel:", plz_ok_form)
+    # Frueher ein print()-Block hinter "if verbose:" — process_meldezettel
+    # erzwang verbose=True, d.h. JEDER Fall im Batch zahlte zehn
+    # stdout-Flushes fuer Ausgaben, die niemand las. logger.debug() mit
+    # %s-Platzhaltern formatiert nur, wenn DEBUG aktiv ist (LOGLEVEL=DEBUG,
+    # wie bei den uebrigen Diagnose-Ausgaben in main.py); der verbose-
+    # Parameter bleibt fuer Alt-Aufrufer in der Signatur erhalten.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Vorname-Match: %s", vorname_ok)
+        logger.debug("Nachname-Match: %s", nachname_ok)
+        logger.debug("Geburtsdatum-Match: %s", geburtsdatum_ok)
+        logger.debug("PLZ foerderberechtigt: %s", plz_ok)
+
+        logger.debug("melde_nachname: %s", melde_nachname)
+        logger.debug("melde_vorname_full: %s", melde_vorname_full)
+        logger.debug("melde_geburtsdatum_iso: %s", melde_geburtsdatum_iso)
+        logger.debug("form_geburtsdatum_iso: %s", form_geburtsdatum_iso)
+        logger.debug("PLZ (Meldezettel) foerderberechtigt: %s", plz_ok_melde)
+        logger.debug("PLZ Formular = PLZ Meldezettel: %s", plz_ok_form)
 
     return result
 
@@ -1020,10 +1448,12 @@ def process_meldezettel(form_data: dict, melde_text: str) -> Dict[str, Any]:
     """
     DEPRECATED: Alte Entry-Funktion fÃ¼r AbwÃ¤rtskompatibilitÃ¤t.
 
-    Ruft validate_meldezettel() mit verbose=True auf (wie die alten Prints).
+    Ruft validate_meldezettel() auf. Die frÃ¼heren print()-Ausgaben sind
+    auf logging umgestellt (sichtbar mit LOGLEVEL=DEBUG), verbose=True
+    erzeugt daher keine stdout-Ausgaben mehr.
 
     Migration:
         Alt:  result = process_meldezettel(form_data, text)
-        Neu:  result = validate_meldezettel(form_data, text, verbose=False)
+        Neu:  result = validate_meldezettel(form_data, text)
     """
-    return validate_meldezettel(form_data, melde_text, verbose=True)
+    return validate_meldezettel(form_data, melde_text)